@@ -23,11 +23,13 @@ export async function transcribeFile(filePath: string, options?: TranscribeOptio
   }
 
   const timeoutMs = options?.timeoutMs ?? config.VOICE_TIMEOUT_MS;
-  const fileBuffer = fs.readFileSync(filePath);
+  // File-backed Blob: the multipart body streams from disk instead of
+  // buffering the whole audio file (up to 25MB) in memory first.
+  const fileBlob = await fs.openAsBlob(filePath);
   const fileName = path.basename(filePath);
 
   const formData = new FormData();
-  formData.append('file', new Blob([fileBuffer]), fileName);
+  formData.append('file', fileBlob, fileName);
   formData.append('model', GROQ_WHISPER_MODEL);
   formData.append('language', config.VOICE_LANGUAGE);
   formData.append('response_format', 'json');
@@ -2570,20 +2570,11 @@ export async function sendTranscriptResult(ctx: Context, transcript: string): Pr
   if (transcript.length <= config.TRANSCRIBE_FILE_THRESHOLD_CHARS) {
     await messageSender.sendMessage(ctx, transcript);
   } else {
-    const tmpPath = path.join(os.tmpdir(), `claudegram_transcript_${Date.now()}.txt`);
-    try {
-      fs.writeFileSync(tmpPath, transcript, { encoding: 'utf-8', mode: 0o600 });
-      const inputFile = new InputFile(fs.readFileSync(tmpPath), 'transcript.txt');
-      await ctx.replyWithDocument(inputFile, {
-        caption: `🎤 Transcript (${transcript.length} chars)`,
-      });
-    } finally {
-      try {
-        if (fs.existsSync(tmpPath)) fs.unlinkSync(tmpPath);
-      } catch (e) {
-        console.warn(`[transcribe] Cleanup failed for ${sanitizePath(tmpPath)}:`, sanitizeError(e));
-      }
-    }
+    // Upload straight from memory — no temp file write + read-back
+    const inputFile = new InputFile(Buffer.from(transcript, 'utf-8'), 'transcript.txt');
+    await ctx.replyWithDocument(inputFile, {
+      caption: `🎤 Transcript (${transcript.length} chars)`,
+    });
   }
 }
 
@@ -2620,8 +2611,7 @@ async function transcribeAndSend(
 
     await downloadTelegramAudio(config.TELEGRAM_BOT_TOKEN, file.file_path, tempFilePath);
 
-    const buf = fs.readFileSync(tempFilePath);
-    if (!buf.length) throw new Error('Downloaded empty audio file.');
+    if (fs.statSync(tempFilePath).size === 0) throw new Error('Downloaded empty audio file.');
 
     const transcript = await transcribeFile(tempFilePath);
 
@@ -3060,7 +3050,8 @@ export async function executeExtract(ctx: Context, url: string, mode: ExtractMod
       const safeTitle = title.replace(/[^a-zA-Z0-9]/g, '_');
       const fileName = `${safeTitle}.${ext}`;
       try {
-        const inputFile = new InputFile(fs.readFileSync(result.subtitlePath), fileName);
+        // Path-backed InputFile streams the upload from disk
+        const inputFile = new InputFile(result.subtitlePath, fileName);
         await ctx.replyWithDocument(inputFile, {
           caption: `\u{1F4DD} ${ext.toUpperCase()} subtitles for: ${title}${durationStr}`,
         });
@@ -3077,21 +3068,14 @@ export async function executeExtract(ctx: Context, url: string, mode: ExtractMod
           parse_mode: 'MarkdownV2',
         });
       } else {
-        // Send as .txt file
-        const tmpPath = path.join(os.tmpdir(), `extract_transcript_${Date.now()}.txt`);
-        try {
-          fs.writeFileSync(tmpPath, result.transcript, { encoding: 'utf-8', mode: 0o600 });
-          const inputFile = new InputFile(fs.readFileSync(tmpPath), `${title.replace(/[^a-zA-Z0-9]/g, '_')}_transcript.txt`);
-          await ctx.replyWithDocument(inputFile, {
-            caption: `\u{1F4DD} Transcript (${result.transcript.length} chars)`,
-          });
-        } finally {
-          try {
-            if (fs.existsSync(tmpPath)) fs.unlinkSync(tmpPath);
-          } catch (e) {
-            console.warn(`[extract] Cleanup failed for ${sanitizePath(tmpPath)}:`, sanitizeError(e));
-          }
-        }
+        // Send as .txt file, uploaded straight from memory
+        const inputFile = new InputFile(
+          Buffer.from(result.transcript, 'utf-8'),
+          `${title.replace(/[^a-zA-Z0-9]/g, '_')}_transcript.txt`
+        );
+        await ctx.replyWithDocument(inputFile, {
+          caption: `\u{1F4DD} Transcript (${result.transcript.length} chars)`,
+        });
       }
     } else if ((mode === 'text' || mode === 'all') && !result.subtitlePath) {
       // Transcript was expected but empty and no subtitle file was sent either
@@ -93,8 +93,8 @@ export async function handleVoice(ctx: Context): Promise<void> {
 
     await downloadFileSecure(fileUrl, tempFilePath);
 
-    const audioBuffer = fs.readFileSync(tempFilePath);
-    if (!audioBuffer.length) {
+    // Only the size matters here — stat instead of reading the whole file
+    if (fs.statSync(tempFilePath).size === 0) {
       throw new Error('Downloaded empty voice file.');
     }
 
@@ -228,8 +228,7 @@ async function handleTranscribeOnly(
 
     await downloadFileSecure(fileUrl, tempFilePath);
 
-    const audioBuffer = fs.readFileSync(tempFilePath);
-    if (!audioBuffer.length) {
+    if (fs.statSync(tempFilePath).size === 0) {
       throw new Error('Downloaded empty voice file.');
     }
 
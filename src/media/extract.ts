@@ -7,6 +7,7 @@ import { transcribeFile } from '../audio/transcribe.js';
 import { sanitizeError, sanitizePath } from '../utils/sanitize.js';
 import { isUrlAllowed } from '../utils/url-guard.js';
 import { resolveBin } from '../utils/resolve-bin.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 
 // ── Types ──────────────────────────────────────────────────────────
 
@@ -35,6 +36,8 @@ export interface ExtractResult {
 
 const MAX_GROQ_FILE_SIZE_MB = 25; // Groq free tier limit
 const CHUNK_DURATION_SEC = 600; // 10 min chunks for large audio
+const CHUNK_TARGET_MB = 20; // headroom below MAX_GROQ_FILE_SIZE_MB per chunk
+const TRANSCRIBE_CONCURRENCY = 4; // parallel Groq requests for chunked audio
 const YTDLP_TIMEOUT_MS = 180_000; // 3 min
 const FFMPEG_TIMEOUT_MS = 120_000; // 2 min
 const FFPROBE_TIMEOUT_MS = 15_000;
@@ -100,13 +103,33 @@ export function platformLabel(platform: Platform): string {
 
 // ── Cookie Support ─────────────────────────────────────────────────
 
-function getCookieArgs(): string[] {
-  if (config.YTDLP_COOKIES_PATH && fs.existsSync(config.YTDLP_COOKIES_PATH)) {
-    return ['--cookies', config.YTDLP_COOKIES_PATH];
+function getCookieArgs(cookiesPath = config.YTDLP_COOKIES_PATH): string[] {
+  if (cookiesPath && fs.existsSync(cookiesPath)) {
+    return ['--cookies', cookiesPath];
   }
   return [];
 }
 
+/**
+ * yt-dlp writes the cookie jar back on exit, so two concurrent runs sharing
+ * one --cookies file can clobber each other. Give a concurrent run its own
+ * copy in outputDir; cookie updates from that run are discarded with it.
+ * Returns undefined (use the shared file) when there is nothing to copy.
+ */
+function copyCookiesForConcurrentRun(outputDir: string): string | undefined {
+  const source = config.YTDLP_COOKIES_PATH;
+  if (!source || !fs.existsSync(source)) return undefined;
+  const copyPath = path.join(outputDir, 'cookies-video.txt');
+  try {
+    fs.copyFileSync(source, copyPath);
+    fs.chmodSync(copyPath, 0o600);
+    return copyPath;
+  } catch (err) {
+    console.warn('[extract] Failed to copy cookies, using shared file:', sanitizeError(err));
+    return undefined;
+  }
+}
+
 // ── Proxy Support (fallback only) ──────────────────────────────────
 
 let proxyList: string[] = [];
@@ -115,15 +138,16 @@ let proxyIndex = 0;
 function loadProxies(): void {
   if (!config.YTDLP_PROXY_LIST_PATH) return;
   try {
-    if (fs.existsSync(config.YTDLP_PROXY_LIST_PATH)) {
-      proxyList = fs.readFileSync(config.YTDLP_PROXY_LIST_PATH, 'utf-8')
-        .split('\n')
-        .map(line => line.trim())
-        .filter(line => line && !line.startsWith('#'));
-      console.log(`[extract] Loaded ${proxyList.length} proxies from ${config.YTDLP_PROXY_LIST_PATH}`);
-    }
+    proxyList = fs.readFileSync(config.YTDLP_PROXY_LIST_PATH, 'utf-8')
+      .split('\n')
+      .map(line => line.trim())
+      .filter(line => line && !line.startsWith('#'));
+    console.log(`[extract] Loaded ${proxyList.length} proxies from ${config.YTDLP_PROXY_LIST_PATH}`);
   } catch (err) {
-    console.warn('[extract] Failed to load proxy list:', err);
+    // A missing list just means no proxy fallback
+    if ((err as NodeJS.ErrnoException).code !== 'ENOENT') {
+      console.warn('[extract] Failed to load proxy list:', err);
+    }
   }
 }
 
@@ -141,10 +165,11 @@ function getNextProxy(): string | null {
 function runCommand(
   cmd: string,
   args: string[],
-  timeoutMs: number
+  timeoutMs: number,
+  signal?: AbortSignal
 ): Promise<{ stdout: string; stderr: string }> {
   return new Promise((resolve, reject) => {
-    execFile(cmd, args, { timeout: timeoutMs, maxBuffer: 10 * 1024 * 1024 }, (error, stdout, stderr) => {
+    execFile(cmd, args, { timeout: timeoutMs, maxBuffer: 10 * 1024 * 1024, signal }, (error, stdout, stderr) => {
       if (error) {
         reject(new Error(`${cmd} failed: ${(stderr || '').trim() || error.message}`));
         return;
@@ -154,6 +179,13 @@ function runCommand(
   });
 }
 
+interface YtDlpRunOptions {
+  /** Kills the yt-dlp process (and skips the proxy retry) when aborted */
+  signal?: AbortSignal;
+  /** Cookie file to use instead of config.YTDLP_COOKIES_PATH */
+  cookiesPath?: string;
+}
+
 /**
  * Run a yt-dlp command with automatic proxy fallback.
  * First tries without proxy. If it fails with an IP/auth error and proxies
@@ -166,22 +198,24 @@ async function runYtDlp(
   baseArgs: string[],
   url: string,
   timeoutMs: number,
-  onRetry?: (msg: string) => void
+  onRetry?: (msg: string) => void,
+  opts: YtDlpRunOptions = {}
 ): Promise<{ stdout: string; stderr: string }> {
   // Add '--' separator before URL to prevent injection attacks
-  const args = [...baseArgs, ...getCookieArgs(), '--', url];
+  const cookieArgs = getCookieArgs(opts.cookiesPath);
+  const args = [...baseArgs, ...cookieArgs, '--', url];
 
   try {
-    return await runCommand(resolveBin('yt-dlp'), args, timeoutMs);
+    return await runCommand(resolveBin('yt-dlp'), args, timeoutMs, opts.signal);
   } catch (err) {
     const errMsg = err instanceof Error ? err.message : '';
 
-    if (shouldRetryWithProxy(errMsg)) {
+    if (!opts.signal?.aborted && shouldRetryWithProxy(errMsg)) {
       const proxy = getNextProxy();
       if (proxy) {
         console.log(`[extract] Retrying with proxy after: ${errMsg.slice(0, 100)}`);
         onRetry?.('\u{1F310} Retrying with proxy...');
-        return await runCommand(resolveBin('yt-dlp'), [...baseArgs, ...getCookieArgs(), '--proxy', proxy, '--', url], timeoutMs);
+        return await runCommand(resolveBin('yt-dlp'), [...baseArgs, ...cookieArgs, '--proxy', proxy, '--', url], timeoutMs, opts.signal);
       }
     }
 
@@ -216,17 +250,25 @@ async function getVideoMeta(url: string, onRetry?: (msg: string) => void): Promi
 
 // ── Audio Download ─────────────────────────────────────────────────
 
+/**
+ * Download the audio track.
+ * 'mp3' re-encodes for delivery to Telegram. 'm4a' prefers the source's AAC
+ * stream, so yt-dlp remuxes it without decoding. That is enough for Whisper.
+ */
 async function downloadAudio(
   url: string,
   outputDir: string,
-  onRetry?: (msg: string) => void
+  onRetry?: (msg: string) => void,
+  format: 'mp3' | 'm4a' = 'mp3'
 ): Promise<string> {
   const outputTemplate = path.join(outputDir, 'audio.%(ext)s');
+  const formatArgs = format === 'm4a'
+    ? ['-f', 'bestaudio[ext=m4a]/bestaudio/best', '--audio-format', 'm4a']
+    : ['--audio-format', 'mp3', '--audio-quality', '0'];
 
   await runYtDlp([
     '-x',
-    '--audio-format', 'mp3',
-    '--audio-quality', '0',
+    ...formatArgs,
     '-o', outputTemplate,
     '--no-playlist',
     '--socket-timeout', '30',
@@ -246,7 +288,8 @@ async function downloadAudio(
 async function downloadVideo(
   url: string,
   outputDir: string,
-  onRetry?: (msg: string) => void
+  onRetry?: (msg: string) => void,
+  opts: YtDlpRunOptions = {}
 ): Promise<string> {
   const outputTemplate = path.join(outputDir, 'video.%(ext)s');
 
@@ -259,7 +302,7 @@ async function downloadVideo(
     '--retries', '3',
     '--no-warnings',
     '--max-filesize', `${TELEGRAM_VIDEO_MAX_MB}M`,
-  ], url, YTDLP_TIMEOUT_MS, onRetry);
+  ], url, YTDLP_TIMEOUT_MS, onRetry, opts);
 
   const files = fs.readdirSync(outputDir).filter(f => f.startsWith('video.'));
   if (files.length === 0) {
@@ -303,6 +346,10 @@ async function downloadSubtitles(
   }
 }
 
+const VTT_TIMESTAMP_RE = /^\d{2}:\d{2}/;
+const SRT_SEQUENCE_RE = /^\d+$/;
+const HTML_TAG_RE = /<[^>]+>/g;
+
 /**
  * Convert VTT subtitle content to plain text (strip timestamps and formatting).
  */
@@ -317,10 +364,10 @@ function vttToPlainText(vttContent: string): string {
     if (!trimmed) continue;
     if (trimmed === 'WEBVTT') continue;
     if (trimmed.startsWith('Kind:') || trimmed.startsWith('Language:')) continue;
-    if (/^\d{2}:\d{2}/.test(trimmed)) continue; // timestamp line
-    if (/^\d+$/.test(trimmed)) continue; // sequence number (SRT)
+    if (VTT_TIMESTAMP_RE.test(trimmed)) continue; // timestamp line
+    if (SRT_SEQUENCE_RE.test(trimmed)) continue; // sequence number (SRT)
     // Strip HTML tags
-    const clean = trimmed.replace(/<[^>]+>/g, '').trim();
+    const clean = trimmed.replace(HTML_TAG_RE, '').trim();
     if (!clean) continue;
     // Deduplicate consecutive identical lines (auto-subs repeat)
     if (clean !== lastLine) {
@@ -354,34 +401,40 @@ async function getAudioDuration(filePath: string): Promise<number> {
 async function chunkAudio(
   inputPath: string,
   outputDir: string,
-  chunkDurationSec: number
+  fileSizeMB: number
 ): Promise<string[]> {
   const duration = await getAudioDuration(inputPath);
+  // Size-proportional chunk length keeps each stream-copied chunk under the upload limit
+  const chunkDurationSec = Math.max(
+    1,
+    Math.min(CHUNK_DURATION_SEC, Math.floor((duration * CHUNK_TARGET_MB) / fileSizeMB))
+  );
   const numChunks = Math.ceil(duration / chunkDurationSec);
 
   if (numChunks <= 1) {
     return [inputPath];
   }
 
-  const chunks: string[] = [];
-  for (let i = 0; i < numChunks; i++) {
-    const startSec = i * chunkDurationSec;
-    const chunkPath = path.join(outputDir, `chunk_${i}.mp3`);
-
-    await runCommand(resolveBin('ffmpeg'), [
-      '-y',
-      '-i', inputPath,
-      '-ss', String(startSec),
-      '-t', String(chunkDurationSec),
-      '-c:a', 'libmp3lame',
-      '-q:a', '2',
-      chunkPath,
-    ], FFMPEG_TIMEOUT_MS);
-
-    if (fs.existsSync(chunkPath) && fs.statSync(chunkPath).size > 0) {
-      chunks.push(chunkPath);
-    }
-  }
+  const ext = path.extname(inputPath) || '.mp3';
+
+  // One ffmpeg process cuts every chunk via the segment muxer (stream copy),
+  // instead of paying a process cold-start per chunk
+  await runCommand(resolveBin('ffmpeg'), [
+    '-y',
+    '-i', inputPath,
+    '-vn',
+    '-c', 'copy',
+    '-f', 'segment',
+    '-segment_time', String(chunkDurationSec),
+    '-reset_timestamps', '1',
+    path.join(outputDir, `chunk_%03d${ext}`),
+  ], FFMPEG_TIMEOUT_MS);
+
+  const chunks = fs.readdirSync(outputDir)
+    .filter(f => f.startsWith('chunk_'))
+    .sort()
+    .map(f => path.join(outputDir, f))
+    .filter(p => fs.statSync(p).size > 0);
 
   if (chunks.length === 0) {
     throw new Error('Audio chunking produced no output');
@@ -410,14 +463,17 @@ async function transcribeAudioFile(
     const chunkDir = path.join(path.dirname(filePath), 'chunks');
     fs.mkdirSync(chunkDir, { recursive: true, mode: 0o700 });
 
-    const chunks = await chunkAudio(filePath, chunkDir, CHUNK_DURATION_SEC);
-    const transcripts: string[] = [];
+    const chunks = await chunkAudio(filePath, chunkDir, fileSizeMB);
 
-    for (let i = 0; i < chunks.length; i++) {
-      onProgress?.(`\u{1F4DD} Transcribing chunk ${i + 1}/${chunks.length}...`);
-      const text = await transcribeFile(chunks[i], transcribeOptions);
-      transcripts.push(text);
-    }
+    // Chunks are independent network-bound requests — fan them out
+    onProgress?.(`\u{1F4DD} Transcribing ${chunks.length} chunks...`);
+    let completed = 0;
+    const transcripts = await mapWithConcurrency(chunks, TRANSCRIBE_CONCURRENCY, async (chunk) => {
+      const text = await transcribeFile(chunk, transcribeOptions);
+      completed++;
+      onProgress?.(`\u{1F4DD} Transcribed chunk ${completed}/${chunks.length}...`);
+      return text;
+    });
 
     return transcripts.join(' ');
   }
@@ -453,6 +509,10 @@ export async function extractMedia(opts: ExtractOptions): Promise<ExtractResult>
     warnings: [],
   };
 
+  // Settles (never rejects) so an audio-side failure can't leave it unhandled
+  let videoDownload: Promise<{ videoPath: string } | { error: unknown }> | undefined;
+  const videoAbort = new AbortController();
+
   try {
     // Get metadata
     onProgress?.(`${emoji} Fetching metadata...`);
@@ -464,6 +524,18 @@ export async function extractMedia(opts: ExtractOptions): Promise<ExtractResult>
     const wantsAudio = mode === 'audio' || mode === 'all';
     const wantsVideo = mode === 'video' || mode === 'all';
 
+    // Start the video download first so it overlaps with audio download and
+    // transcription (mode 'all') instead of waiting for them to finish.
+    if (wantsVideo) {
+      onProgress?.(`${emoji} Downloading video...`);
+      // Audio/subtitle runs below overlap with this one, so it gets its own cookie jar
+      const cookiesPath = mode === 'all' ? copyCookiesForConcurrentRun(tempDir) : undefined;
+      videoDownload = downloadVideo(url, tempDir, onProgress, { signal: videoAbort.signal, cookiesPath }).then(
+        (videoPath) => ({ videoPath }),
+        (error: unknown) => ({ error }),
+      );
+    }
+
     // For YouTube with subtitle format, try YouTube's own subtitles first
     const useYouTubeSubs = wantsText && platform === 'youtube' && subtitleFormat;
 
@@ -491,7 +563,8 @@ export async function extractMedia(opts: ExtractOptions): Promise<ExtractResult>
     const needsAudio = wantsAudio || (wantsText && !result.transcript && !result.subtitlePath);
     if (needsAudio) {
       onProgress?.(`${emoji} Downloading audio...`);
-      const audioPath = await downloadAudio(url, tempDir, onProgress);
+      // Audio that is only transcribed skips the mp3 re-encode
+      const audioPath = await downloadAudio(url, tempDir, onProgress, wantsAudio ? 'mp3' : 'm4a');
       result.audioPath = audioPath;
 
       // Transcribe if text was requested and we don't already have subtitles
@@ -502,19 +575,19 @@ export async function extractMedia(opts: ExtractOptions): Promise<ExtractResult>
       }
     }
 
-    // Download video
-    if (wantsVideo) {
-      onProgress?.(`${emoji} Downloading video...`);
+    // Collect the video download started above
+    if (videoDownload) {
       try {
-        const videoPath = await downloadVideo(url, tempDir, onProgress);
-        const videoSize = fs.statSync(videoPath).size;
+        const outcome = await videoDownload;
+        if ('error' in outcome) throw outcome.error;
+        const videoSize = fs.statSync(outcome.videoPath).size;
 
         if (videoSize > TELEGRAM_VIDEO_MAX_MB * 1024 * 1024) {
           result.warnings.push(
             `Video is ${(videoSize / 1024 / 1024).toFixed(1)}MB — exceeds Telegram's ${TELEGRAM_VIDEO_MAX_MB}MB limit.`
           );
         } else {
-          result.videoPath = videoPath;
+          result.videoPath = outcome.videoPath;
         }
       } catch (videoErr) {
         const msg = videoErr instanceof Error ? videoErr.message : 'Unknown error';
@@ -535,6 +608,15 @@ export async function extractMedia(opts: ExtractOptions): Promise<ExtractResult>
 
     return result;
   } catch (error) {
+    // Callers get no result to clean up on failure, so stop any in-flight video
+    // download, wait for yt-dlp to exit, and remove tempDir here
+    videoAbort.abort();
+    await videoDownload;
+    try {
+      fs.rmSync(tempDir, { recursive: true, force: true });
+    } catch (e) {
+      console.warn(`[extract] Cleanup failed for ${sanitizePath(tempDir)}:`, sanitizeError(e));
+    }
     const msg = sanitizeError(error);
     console.error('[extract] Error:', msg);
     throw new Error(msg);
@@ -1,7 +1,8 @@
-import * as cheerio from 'cheerio';
+import type { Cheerio, CheerioAPI } from 'cheerio';
 import type { AnyNode } from 'domhandler';
-import TurndownService from 'turndown';
+import type TurndownService from 'turndown';
 import { config } from '../config.js';
+import { BoundedMap } from '../utils/bounded-map.js';
 
 export interface FreediumArticle {
   title: string;
@@ -31,6 +32,16 @@ const KNOWN_MEDIUM_DOMAINS = new Set([
   'aws.plainenglish.io',
 ]);
 
+const FREEDIUM_HEADERS = {
+  'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+  'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+};
+
+// In-flight and recently fetched articles — concurrent or repeat requests for
+// the same URL share one fetch instead of queueing behind the rate limiter again
+const ARTICLE_CACHE_TTL_MS = 10 * 60 * 1000;
+const articleCache = new BoundedMap<string, { article: Promise<FreediumArticle>; expiresAt: number }>(50);
+
 // Simple rate limiter
 let lastRequestTime = 0;
 
@@ -71,17 +82,38 @@ export function toFreediumUrl(url: string): string {
 
 /**
  * Fetch a Medium article via Freedium and convert to Markdown.
+ * Concurrent and repeat requests for the same URL share one fetch for a few
+ * minutes; failed fetches are not cached. Each caller gets its own copy.
  */
 export async function fetchMediumArticle(url: string): Promise<FreediumArticle> {
+  let entry = articleCache.get(url);
+  if (entry && entry.expiresAt <= Date.now()) {
+    articleCache.delete(url);
+    entry = undefined;
+  }
+
+  if (!entry) {
+    const newEntry = { article: fetchFromFreedium(url), expiresAt: Date.now() + ARTICLE_CACHE_TTL_MS };
+    articleCache.set(url, newEntry);
+    newEntry.article.catch(() => {
+      // Only drop our own entry — a newer fetch may have replaced it
+      if (articleCache.get(url) === newEntry) {
+        articleCache.delete(url);
+      }
+    });
+    entry = newEntry;
+  }
+
+  return { ...(await entry.article) };
+}
+
+async function fetchFromFreedium(url: string): Promise<FreediumArticle> {
   await rateLimit();
 
   const freediumUrl = toFreediumUrl(url);
 
   const response = await fetch(freediumUrl, {
-    headers: {
-      'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-      'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-    },
+    headers: FREEDIUM_HEADERS,
     signal: AbortSignal.timeout(config.MEDIUM_TIMEOUT_MS),
   });
 
@@ -90,7 +122,11 @@ export async function fetchMediumArticle(url: string): Promise<FreediumArticle>
   }
 
   const html = await response.text();
-  const $ = cheerio.load(html);
+  // Loaded on first use so bot startup doesn't pay for the HTML parser
+  const cheerio = await import('cheerio');
+  // htmlparser2 (via the `xml` option, in HTML mode) is considerably faster
+  // than cheerio's default spec-compliant parse5 on large article pages
+  const $ = cheerio.load(html, { xml: { xmlMode: false } });
 
   // Extract title
   const title = $('h1.title').first().text().trim()
@@ -117,24 +153,21 @@ export async function fetchMediumArticle(url: string): Promise<FreediumArticle>
   return convertToArticle($, mainContent, title, author, url);
 }
 
-function convertToArticle(
-  $: cheerio.CheerioAPI,
-  contentEl: cheerio.Cheerio<AnyNode>,
-  title: string,
-  author: string,
-  url: string,
-): FreediumArticle {
-  // Remove scripts, styles, nav elements from content
-  contentEl.find('script, style, nav, .sidebar, .footer').remove();
+// Built once on first use and reused; converting doesn't mutate the service
+let turndownService: TurndownService | null = null;
+
+async function getTurndown(): Promise<TurndownService> {
+  if (turndownService) return turndownService;
 
-  const turndown = new TurndownService({
+  const { default: Turndown } = await import('turndown');
+  const service = new Turndown({
     headingStyle: 'atx',
     codeBlockStyle: 'fenced',
     bulletListMarker: '-',
   });
 
   // Preserve code blocks
-  turndown.addRule('pre', {
+  service.addRule('pre', {
     filter: 'pre',
     replacement: (_content, node) => {
       const text = (node as { textContent?: string }).textContent || '';
@@ -142,6 +175,22 @@ function convertToArticle(
     },
   });
 
+  turndownService = service;
+  return service;
+}
+
+async function convertToArticle(
+  $: CheerioAPI,
+  contentEl: Cheerio<AnyNode>,
+  title: string,
+  author: string,
+  url: string,
+): Promise<FreediumArticle> {
+  // Remove scripts, styles, nav elements from content
+  contentEl.find('script, style, nav, .sidebar, .footer').remove();
+
+  const turndown = await getTurndown();
+
   const contentHtml = contentEl.html() || '';
   const markdown = turndown.turndown(contentHtml).trim();
 
@@ -624,33 +624,48 @@ export async function executeVReddit(ctx: Context, input: string): Promise<void>
 
       const videoExt = getUrlExtension(streams.videoUrl, '.mp4');
       const videoPath = path.join(tempDir, `video${videoExt}`);
-      debugLog('[vReddit] Downloading video stream...');
-      const videoSize = await downloadFile(streams.videoUrl, videoPath, VIDEO_DOWNLOAD_TIMEOUT_SEC);
+
+      const audioUrl = streams.audioUrl;
+      let audioPath: string | null = null;
+      if (audioUrl) {
+        if (!(await isUrlAllowed(audioUrl))) {
+          debugLog('[vReddit] Blocked audio stream URL (private network), sending video-only');
+        } else {
+          audioPath = path.join(tempDir, `audio${getUrlExtension(audioUrl, '.mp4')}`);
+        }
+      }
+
+      // DASH video and audio are independent files — download them concurrently.
+      // Wait for both to settle so neither curl outlives tempDir cleanup.
+      debugLog(audioPath ? '[vReddit] Downloading video + audio streams...' : '[vReddit] Downloading video stream...');
+      const [videoResult, audioResult] = await Promise.allSettled([
+        downloadFile(streams.videoUrl, videoPath, VIDEO_DOWNLOAD_TIMEOUT_SEC),
+        audioUrl && audioPath ? downloadFile(audioUrl, audioPath, VIDEO_DOWNLOAD_TIMEOUT_SEC) : null,
+      ]);
+      if (videoResult.status === 'rejected') {
+        throw videoResult.reason;
+      }
+      if (audioResult.status === 'rejected') {
+        console.warn('[vReddit] Audio download failed, sending video-only:', audioResult.reason);
+        audioPath = null;
+      }
+      const videoSize = videoResult.value;
       debugLog(`[vReddit] Video downloaded: ${(videoSize / 1024 / 1024).toFixed(1)}MB`);
 
       finalPath = videoPath;
       finalSize = videoSize;
 
-      if (streams.audioUrl) {
-        if (!(await isUrlAllowed(streams.audioUrl))) {
-          debugLog('[vReddit] Blocked audio stream URL (private network), sending video-only');
-        } else {
-          const audioExt = getUrlExtension(streams.audioUrl, '.mp4');
-          const audioPath = path.join(tempDir, `audio${audioExt}`);
-          debugLog('[vReddit] Downloading audio stream...');
-          await downloadFile(streams.audioUrl, audioPath, VIDEO_DOWNLOAD_TIMEOUT_SEC);
-
-          const mergedPath = path.join(tempDir, 'video_merged.mp4');
-          try {
-            console.log('[vReddit] Merging video + audio...');
-            await mergeVideoAudio(videoPath, audioPath, mergedPath);
-            const stat = fs.statSync(mergedPath);
-            finalPath = mergedPath;
-            finalSize = stat.size;
-            console.log(`[vReddit] Merged: ${(finalSize / 1024 / 1024).toFixed(1)}MB`);
-          } catch (error) {
-            console.warn('[vReddit] Merge failed, sending video-only:', error);
-          }
+      if (audioPath) {
+        const mergedPath = path.join(tempDir, 'video_merged.mp4');
+        try {
+          console.log('[vReddit] Merging video + audio...');
+          await mergeVideoAudio(videoPath, audioPath, mergedPath);
+          const stat = fs.statSync(mergedPath);
+          finalPath = mergedPath;
+          finalSize = stat.size;
+          console.log(`[vReddit] Merged: ${(finalSize / 1024 / 1024).toFixed(1)}MB`);
+        } catch (error) {
+          console.warn('[vReddit] Merge failed, sending video-only:', error);
         }
       }
     } else {
@@ -1,10 +1,11 @@
-import OpenAI from 'openai';
+import type OpenAI from 'openai';
 import { config } from '../config.js';
 import * as fs from 'fs';
 import * as path from 'path';
 import * as os from 'os';
 import { execFile } from 'child_process';
 import { resolveBin } from '../utils/resolve-bin.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 
 // ── OpenAI provider ────────────────────────────────────────────────
 
@@ -20,7 +21,9 @@ async function generateSpeechOpenAI(text: string, voice?: string): Promise<Buffe
     throw new Error('OPENAI_API_KEY not configured.');
   }
   if (!openai) {
-    openai = new OpenAI({ apiKey: config.OPENAI_API_KEY });
+    // Only the OpenAI provider needs the SDK — load it on first use
+    const { default: OpenAIClient } = await import('openai');
+    openai = new OpenAIClient({ apiKey: config.OPENAI_API_KEY });
   }
 
   const model = config.TTS_MODEL;
@@ -46,6 +49,7 @@ async function generateSpeechOpenAI(text: string, voice?: string): Promise<Buffe
 const GROQ_TTS_ENDPOINT = 'https://api.groq.com/openai/v1/audio/speech';
 const GROQ_TTS_MODEL = 'canopylabs/orpheus-v1-english';
 const GROQ_MAX_CHARS = 200;
+const GROQ_TTS_CONCURRENCY = 4; // parallel chunk requests per reply
 
 /**
  * Split text into chunks of at most maxLen characters, breaking at sentence
@@ -245,11 +249,10 @@ async function generateSpeechGroq(text: string, voice?: string): Promise<Buffer>
 
   console.log(`[TTS/Groq] Generating speech: ${chunks.length} chunk(s), voice=${selectedVoice}`);
 
-  const wavBuffers: Buffer[] = [];
-  for (const chunk of chunks) {
-    const wav = await groqTTSSingle(chunk, selectedVoice);
-    wavBuffers.push(wav);
-  }
+  // Chunks are independent requests; results come back in order for concat
+  const wavBuffers = await mapWithConcurrency(chunks, GROQ_TTS_CONCURRENCY, (chunk) =>
+    groqTTSSingle(chunk, selectedVoice)
+  );
 
   return concatAndConvertAudio(wavBuffers);
 }